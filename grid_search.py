@@ -1,7 +1,8 @@
 import concurrent.futures
 import itertools
+import os
 import sys
-from importlib import import_module, reload
+from importlib import import_module
 from pathlib import Path
 
 import numpy as np
@@ -25,18 +26,23 @@ def load_trader_class(algo_path: Path):
 
 
 def profit_of(result):
-    # Assume the "profit" is computed as the sum of the last timestamp’s profit
-    last_ts = result.activity_logs[-1].timestamp
-    return sum(
-        row.columns[-1] for row in result.activity_logs if row.timestamp == last_ts
-    )
+    # Assume the "profit" is computed as the sum of the last timestamp’s profit.
+    # Rows are timestamp-ordered, so scan back only through the last timestamp.
+    logs = result.activity_logs
+    last_ts = logs[-1].timestamp
+    total = 0.0
+    for row in reversed(logs):
+        if row.timestamp != last_ts:
+            break
+        total += row.columns[-1]
+    return total
 
 
 def evaluate(trader_cls, params, file_reader, rounds, days):
-    # Instantiate a new trader with the given parameters.
-    trader = trader_cls(**params)
     total = 0.0
     for r, d in itertools.product(rounds, days):
+        # Fresh trader per (round, day) so no state carries across backtests.
+        trader = trader_cls(**params)
         result = run_backtest(
             trader,
             file_reader,
@@ -48,17 +54,29 @@ def evaluate(trader_cls, params, file_reader, rounds, days):
             False,  # show_progress
         )
         total += profit_of(result)
-        reload(sys.modules[trader.__module__])
     return total
 
 
+# Set once per process by _init_worker. Every task in a worker shares this one
+# class object (the module is no longer reloaded per task), so Traders must keep
+# no mutable class-level state or it leaks between tasks.
+TRADER_CLS = None
+FILE_READER = None
+ROUNDS = DAYS = ()
+
+
+def _init_worker(algo_path, rounds, days):
+    # Import the Trader and build the data reader once per process.
+    global TRADER_CLS, FILE_READER, ROUNDS, DAYS
+    TRADER_CLS = load_trader_class(Path(algo_path))
+    FILE_READER = PackageResourcesReader()
+    ROUNDS, DAYS = rounds, days
+
+
 def worker(args):
-    algo_path, params, rounds, days = args
-    # Reload the Trader for each process.
-    Trader = load_trader_class(Path(algo_path))
-    file_reader = PackageResourcesReader()
-    score = evaluate(Trader, params, file_reader, rounds, days)
-    return params, score
+    # Only the task index and score travel back to the parent.
+    idx, params = args
+    return idx, evaluate(TRADER_CLS, params, FILE_READER, ROUNDS, DAYS)
 
 
 def main():
@@ -73,23 +91,28 @@ def main():
     rounds = [0]
     days = [-1]
 
-    # Build a list of parameter combinations as a list of tuples for the worker function.
+    # Build a list of parameter combinations; workers receive (index, params).
     tasks = []
     # make sure to UDPATE THIS WITH THE CORRECT PARAMETERS
     for alpha, window, inv in itertools.product(alphas, windows, inv_skews):
-        params = {"alpha": alpha, "vol_window": window, "inv_skew": inv}
-        tasks.append((algo_path, params, rounds, days))
+        tasks.append({"alpha": alpha, "vol_window": window, "inv_skew": inv})
 
-    # run evaluations in parallel.
+    # run evaluations in parallel, a few chunks per worker to cut IPC round-trips.
+    # n_workers only sizes the chunks; the pool keeps its own default size.
+    n_workers = os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (n_workers * 4))
     best = {"score": -float("inf"), "params": None}
-    with concurrent.futures.ProcessPoolExecutor() as executor:
-        results = executor.map(worker, tasks)
-
-    for params, score in results:
-        print(f"Tested {params!r} => profit = {score:,.0f}")
-        if score > best["score"]:
-            best["score"] = score
-            best["params"] = params
+    with concurrent.futures.ProcessPoolExecutor(
+        initializer=_init_worker,
+        initargs=(algo_path, rounds, days),
+    ) as executor:
+        results = executor.map(worker, enumerate(tasks), chunksize=chunksize)
+        for idx, score in results:
+            params = tasks[idx]
+            print(f"Tested {params!r} => profit = {score:,.0f}")
+            if score > best["score"]:
+                best["score"] = score
+                best["params"] = params
 
     print("\nBest params:", best["params"], "=> profit:", best["score"])
 
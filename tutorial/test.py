@@ -1,7 +1,8 @@
 from datamodel import Order, OrderDepth, TradingState
 from typing import Dict, List
-import jsonpickle
-import statistics as stats
+from collections import deque
+import base64
+import struct
 
 
 class Trader:
@@ -11,36 +12,98 @@ class Trader:
     VOL_WINDOW = 20
     INV_SKEW = 0.04
     PASSIVE_SIZE = 3          # qty posted on each side
+    DEBUG = False             # per-tick logging; keep off for backtests
+    # traderData record: name length + name, then fv, window sum,
+    # window sum of squares, window length, and the window doubles
+    _MEM_HDR = struct.Struct("<dddI")
 
     @staticmethod
     def _best(depth: OrderDepth):
-        bid = max(depth.buy_orders.items()) if depth.buy_orders else (None, 0)
-        ask = min(depth.sell_orders.items()
-                  ) if depth.sell_orders else (None, 0)
-        return bid, ask
+        # extreme key, then one lookup – no (price, qty) tuple per level;
+        # both volumes come back as positive magnitudes
+        bo, so = depth.buy_orders, depth.sell_orders
+        bid_px = max(bo) if bo else None
+        ask_px = min(so) if so else None
+        return ((bid_px, bo[bid_px] if bid_px is not None else 0),
+                (ask_px, -so[ask_px] if ask_px is not None else 0))
+
+    @classmethod
+    def _encode_mem(cls, mem) -> str:
+        # one record per product, keyed by name so any product set round-trips
+        buf = bytearray()
+        for prod, fv in mem.get("fv", {}).items():
+            roll = mem["roll"][prod]
+            name = prod.encode()
+            buf.append(len(name))
+            buf += name
+            buf += cls._MEM_HDR.pack(fv, mem["sum"][prod], mem["sumsq"][prod],
+                                     len(roll))
+            buf += struct.pack(f"<{len(roll)}d", *roll)
+        return base64.b64encode(buf).decode()
+
+    def _decode_mem(self, data: str):
+        # instance method: windows must use the same VOL_WINDOW as run()
+        raw = base64.b64decode(data)
+        mem = {"roll": {}, "fv": {}, "sum": {}, "sumsq": {}}
+        off = 0
+        while off < len(raw):
+            end = off + 1 + raw[off]
+            prod = raw[off + 1:end].decode()
+            fv, s, sq, n = self._MEM_HDR.unpack_from(raw, end)
+            off = end + self._MEM_HDR.size
+            roll = deque(struct.unpack_from(f"<{n}d", raw, off),
+                         maxlen=self.VOL_WINDOW)
+            off += 8 * n
+            if n > len(roll):
+                # stored window was longer than ours: resync the sums
+                s = sum(roll)
+                sq = sum(x * x for x in roll)
+            mem["fv"][prod] = fv
+            mem["sum"][prod] = s
+            mem["sumsq"][prod] = sq
+            mem["roll"][prod] = roll
+        return mem
 
     def run(self, state: TradingState):
-        mem = jsonpickle.decode(state.traderData) if state.traderData else {}
+        mem = self._decode_mem(state.traderData) if state.traderData else {}
         results: Dict[str, List[Order]] = {}
+        # bind per-tick invariants once so the product loop uses fast locals
+        alpha, base_edge, window = self.ALPHA, self.BASE_EDGE, self.VOL_WINDOW
+        inv_skew, passive_size = self.INV_SKEW, self.PASSIVE_SIZE
+        limits = self.LIMITS
+        rolls, fvs = mem.setdefault("roll", {}), mem.setdefault("fv", {})
+        sums, sumsqs = mem.setdefault("sum", {}), mem.setdefault("sumsq", {})
 
         for prod, depth in state.order_depths.items():
-            (bid_px, bid_qty), (ask_px, ask_qty) = self._best(depth)
-            if bid_px is None or ask_px is None:
+            # one-sided book: no mid to price from, skip before scanning it
+            if not depth.buy_orders or not depth.sell_orders:
                 continue
+            (bid_px, bid_qty), (ask_px, ask_qty) = self._best(depth)
             mid = (bid_px + ask_px) / 2
 
             # ── rolling stats & fair value ────────────────────────────────
-            roll = mem.setdefault("roll", {}).setdefault(prod, [])
+            # running sum / sum of squares keep the window stats O(1)
+            roll = rolls.get(prod)
+            if roll is None:
+                roll = rolls[prod] = deque(maxlen=window)
+            s = sums.get(prod, 0.0)
+            sq = sumsqs.get(prod, 0.0)
+            if roll.maxlen and len(roll) == roll.maxlen:
+                old = roll[0]
+                s -= old
+                sq -= old * old
             roll.append(mid)
-            roll[-self.VOL_WINDOW:]
-            fv_prev = mem.setdefault("fv", {}).get(prod, mid)
-            fv = self.ALPHA * mid + (1 - self.ALPHA) * fv_prev
-            mem["fv"][prod] = fv
-            sigma = stats.stdev(roll) if len(roll) > 5 else 0
-            edge = self.BASE_EDGE + 0.5 * sigma
+            s += mid
+            sq += mid * mid
+            sums[prod], sumsqs[prod] = s, sq
+            fv = alpha * mid + (1 - alpha) * fvs.get(prod, mid)
+            fvs[prod] = fv
+            n = len(roll)
+            sigma = max(0.0, (sq - s * s / n) / (n - 1)) ** 0.5 if n > 5 else 0
+            edge = base_edge + 0.5 * sigma
 
-            pos, lim = state.position.get(prod, 0), self.LIMITS[prod]
-            skew = self.INV_SKEW * (pos / lim) * edge * 2
+            pos, lim = state.position.get(prod, 0), limits[prod]
+            skew = inv_skew * (pos / lim) * edge * 2
             bid_target = round(fv - edge - skew)
             ask_target = round(fv + edge - skew)
 
@@ -48,7 +111,7 @@ class Trader:
 
             # ── 1. cross the spread when advantageous ────────────────────
             if ask_px < bid_target and pos < lim:
-                qty = min(-ask_qty, lim - pos)
+                qty = min(ask_qty, lim - pos)
                 orders.append(Order(prod, ask_px, qty))
             if bid_px > ask_target and pos > -lim:
                 qty = min(bid_qty, lim + pos)
@@ -56,15 +119,16 @@ class Trader:
 
             # ── 2. always quote passively at fv±edge ─────────────────────
             # cancel/replace logic is unnecessary – engine cancels resting
-            passive_bid_qty = min(self.PASSIVE_SIZE, lim - pos)
-            passive_ask_qty = min(self.PASSIVE_SIZE, lim + pos)
+            passive_bid_qty = min(passive_size, lim - pos)
+            passive_ask_qty = min(passive_size, lim + pos)
             if passive_bid_qty > 0:
                 orders.append(Order(prod, bid_target, passive_bid_qty))
             if passive_ask_qty > 0:
                 orders.append(Order(prod, ask_target, -passive_ask_qty))
 
             results[prod] = orders
-            print(f"{state.timestamp} {prod} fv={fv:.1f} "
-                  f"bidT={bid_target} askT={ask_target} pos={pos}")
+            if self.DEBUG:
+                print(f"{state.timestamp} {prod} fv={fv:.1f} "
+                      f"bidT={bid_target} askT={ask_target} pos={pos}")
 
-        return results, 0, jsonpickle.encode(mem)
+        return results, 0, self._encode_mem(mem)